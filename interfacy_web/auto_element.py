@@ -1,5 +1,6 @@
 import re
 import sys
+import typing as T
 
 from nicegui import ui
 from nicegui.element import Element
@@ -8,6 +9,8 @@ from interfacy_web.draggable_element import DraggableElement
 from interfacy_web.elements import markdown_heading, tooltip
 from interfacy_web.parser import DEFAULT_VALUES
 
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
 SINGLE_ROW = [sys.maxsize]
 ONE_PER_ROW = [1]  # will auto-expand
 
@@ -71,32 +74,36 @@ class AutoElement(DraggableElement):
             element.move(self.get_current_row())
 
     def get_current_row(self) -> ui.row:
-        try:
-            space_left = self._elements_per_row[self._row_index]
-        except IndexError:
-            self._elements_per_row.append(1)
-            space_left = 1
-
-        if space_left == 0:
-            self._row_index += 1
-            try:
-                space_left = self._elements_per_row[self._row_index]
-            except IndexError:
-                self._elements_per_row.append(1)
-                space_left = 1
-
-        self._elements_per_row[self._row_index] -= 1
-        if len(self.rows) <= self._row_index:
+        elements_per_row = self._elements_per_row
+        index = self._row_index
+        # Fast path: the current row is already created and has space left
+        if index < len(self.rows) and index < len(elements_per_row) and elements_per_row[index] > 0:
+            elements_per_row[index] -= 1
+            return self.rows[index]
+
+        if index >= len(elements_per_row):
+            elements_per_row.append(1)
+
+        if elements_per_row[index] == 0:
+            index += 1
+            self._row_index = index
+            if index >= len(elements_per_row):
+                elements_per_row.append(1)
+
+        elements_per_row[index] -= 1
+        if len(self.rows) <= index:
             self.rows.append(self.new_row())
-        return self.rows[self._row_index]
+        return self.rows[index]
 
     def format_label(self, label: str) -> str:
         return label.replace("_", " ").capitalize()
 
     def format_title(self, title: str) -> str:
-        matches = re.finditer(".+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)", title)
-        words = [m.group(0).capitalize() for m in matches]
-        return " ".join(words)
+        rest = title[1:]
+        if rest == rest.lower():  # no camel case boundaries to split on
+            return title.capitalize()
+        words = _CAMEL_CASE_BOUNDARY_RE.split(title)
+        return " ".join(word.capitalize() for word in words if word)
 
     def build_title_row(self) -> None:
         if self.is_expandable:
@@ -128,14 +135,22 @@ class AutoElement(DraggableElement):
                         with self.icon:
                             tooltip(self._description_text)
 
-    def _build_extra_buttons(self):
-        if self._add_clear_button:
-            with self.get_current_row():
-                self.clear_fields_button = self.create_clear_fields_button()
+    def _get_extra_button_specs(self) -> list[tuple[bool, str, T.Callable[[], ui.button]]]:
+        """
+        Returns:
+            (enabled, attribute name, factory) for every optional button, in display order.
+        """
+        return [
+            (self._add_clear_button, "clear_fields_button", self.create_clear_fields_button),
+            (self._add_delete_button, "delete_button", self.create_delete_button),
+        ]
 
-        if self._add_delete_button:
-            with self.get_current_row():
-                self.delete_button = self.create_delete_button()
+    def _build_extra_buttons(self):
+        with self:
+            for enabled, attr, create_button in self._get_extra_button_specs():
+                if enabled:
+                    with self.get_current_row():
+                        setattr(self, attr, create_button())
 
     def create_delete_button(self):
         button_delete = ui.button(icon="delete", on_click=self.delete_from_parent)
@@ -159,10 +174,11 @@ class AutoElement(DraggableElement):
                 element.move(self.get_current_row())
 
     def clear_fields(self):
-        for k, v in self.field_elements.items():
-            default_val = DEFAULT_VALUES.get(type(v), None)  # type: ignore
+        get_default = DEFAULT_VALUES.get
+        for element in self.field_elements.values():
+            default_val = get_default(type(element), None)  # type: ignore
             if default_val is not None:
-                v.value = default_val  # type: ignore
+                element.value = default_val  # type: ignore
 
     def build(self):
         raise NotImplementedError
@@ -7,7 +7,28 @@ from objinspect import Class, Parameter
 from interfacy_web.auto_element import SINGLE_ROW, AutoElement
 from interfacy_web.elements import notification, tooltip
 from interfacy_web.parser import DEFAULT_VALUES, STR_PARSER, element_for_type
-from interfacy_web.util import element_takes_label, err_message_missing_param, is_type
+from interfacy_web.util import (
+    element_takes_label,
+    err_message_missing_param,
+    exact_types,
+    is_type,
+)
+
+_CLASS_CACHE: dict[type, Class] = {}
+
+
+def inspect_class(cls: T.Any) -> Class:
+    """
+    Return the objinspect `Class` for `cls`, reusing the cached one if `cls` is a type.
+    Cached entries live for the lifetime of the process, `Class` keeps a reference to the type.
+    Instances are inspected every time since the result holds the instance itself.
+    """
+    if not isinstance(cls, type):
+        return Class(cls)
+    obj = _CLASS_CACHE.get(cls)
+    if obj is None:
+        obj = _CLASS_CACHE[cls] = Class(cls)
+    return obj
 
 
 class ClassElement(AutoElement):
@@ -30,11 +51,20 @@ class ClassElement(AutoElement):
         width_class: str = "w-fit-content",
     ) -> None:
         self.cls = cls
-        self.obj = Class(self.cls)
+        self.obj = inspect_class(self.cls)
+        self._instance_values: dict[str, T.Any] | None = (
+            getattr(self.obj.instance, "__dict__", None) if self.obj.is_initialized else None
+        )
         self._title_value = title
         self.ignored_fields = ignored_fields or []
+        self._init_params = self.get_init_params()
+        self._arg_plan = self._build_arg_plan()
         self.n_params = self.get_n_params()
-        elements_per_row = elements_per_row or [1] * (self.n_params + len(extras or []))
+        if not elements_per_row:
+            elements_per_row = [1] * (self.n_params + len(extras or []))
+        else:
+            n_missing = self.n_params - sum(elements_per_row)
+            elements_per_row = elements_per_row + [1] * max(n_missing, 0)
 
         super().__init__(
             elements_per_row=elements_per_row,
@@ -50,7 +80,6 @@ class ClassElement(AutoElement):
             width_class=width_class,
             expandable=expandable,
         )
-        self._fill_elements_per_row()
 
     def get_title(self) -> str | None:
         if isinstance(self._title_value, str):
@@ -72,32 +101,43 @@ class ClassElement(AutoElement):
         return self.obj.init_method._parameters
 
     def get_n_params(self) -> int:
-        params = self.get_init_params()
-        if not params:
-            return 0
-        return sum(1 for i in params.keys() if i not in self.ignored_fields)
+        return sum(1 for i in self._init_params if i not in self.ignored_fields)
+
+    def _build_arg_plan(self) -> dict[str, tuple[bool, bool, T.Any, tuple[type, ...]]]:
+        """
+        Resolve the per-parameter metadata used by `get_args` once, keyed by parameter name.
+        """
+        return {
+            name: (
+                param.is_required,
+                param.is_typed,
+                param.type,
+                exact_types(param.type) if param.is_typed else (),
+            )
+            for name, param in self._init_params.items()
+        }
 
     def get_args(self) -> dict[str, T.Any]:
-        init_params = self.get_init_params()
+        parse = STR_PARSER.parse
         args = {}
         missing_args = {}
-        for k, v in self.field_elements.items():
-            value = v.value  # type: ignore
-            param = init_params[k]
+        plan = self._arg_plan
+        for k, element in self.field_elements.items():
+            is_required, is_typed, type_hint, value_types = plan[k]
+            value = element.value  # type: ignore
 
-            if value is None and param.is_required:
-                missing_args[k] = err_message_missing_param(param)
+            if value is None and is_required:
+                missing_args[k] = err_message_missing_param(self._init_params[k])
                 continue
 
-            if not param.is_typed:
+            if not is_typed or type(value) in value_types:
                 args[k] = value
                 continue
 
-            type_hint = init_params[k].type
             if is_type(value, type_hint):
                 args[k] = value
             else:
-                args[k] = STR_PARSER.parse(value, type_hint)
+                args[k] = parse(value, type_hint)
 
         if missing_args:
             for i in missing_args.values():
@@ -120,7 +160,11 @@ class ClassElement(AutoElement):
 
         # Experimental
         if self.obj.is_initialized:
-            kwargs["value"] = getattr(self.obj.instance, param.name)
+            values = self._instance_values
+            if values is not None and param.name in values:
+                kwargs["value"] = values[param.name]
+            else:
+                kwargs["value"] = getattr(self.obj.instance, param.name)
         elif not param.is_required:
             kwargs["value"] = param.default
 
@@ -135,26 +179,15 @@ class ClassElement(AutoElement):
 
         self.field_elements[param.name] = e
 
-    def _fill_elements_per_row(self) -> None:
-        """
-        Populate elements_per_row with default value in case the user provided too short list
-        """
-        total = sum(self._elements_per_row)
-        if total < self.n_params:
-            n_missing = self.n_params - total
-            self._elements_per_row += [1] * n_missing
-
     def reset_to_defaults(self):
-        init_params = self.get_init_params()
-        if not init_params:
-            return
-
-        for element_field_name, element in self.field_elements.items():
-            param = init_params[element_field_name]
+        init_params = self._init_params
+        get_default = DEFAULT_VALUES.get
+        for name, element in self.field_elements.items():
+            param = init_params[name]
             if not param.is_required:
                 element.value = param.default  # type:ignore
             else:
-                default_val = DEFAULT_VALUES.get(type(element), None)  # type:ignore
+                default_val = get_default(type(element), None)  # type:ignore
                 if default_val is not None:
                     element.value = default_val  # type:ignore
 
@@ -165,21 +198,23 @@ class ClassElement(AutoElement):
                 tooltip("Reset")
         return button
 
-    def _build_extra_buttons(self):
-        super()._build_extra_buttons()
-        with self:
-            if self._add_default_button:
-                with self.get_current_row():
-                    self.reset_to_defaults_button = self.create_reset_to_defaults_button()
+    def _get_extra_button_specs(self) -> list[tuple[bool, str, T.Callable[[], ui.button]]]:
+        return [
+            *super()._get_extra_button_specs(),
+            (
+                self._add_default_button,
+                "reset_to_defaults_button",
+                self.create_reset_to_defaults_button,
+            ),
+        ]
 
     def build(self) -> None:
-        init_method = self.obj.init_method
-        if not init_method:
+        if not self.obj.init_method:
             return
 
         self.build_title_row()
 
-        for param in init_method.params:
+        for param in self._init_params.values():
             if param.name in self.ignored_fields:
                 continue
             with self.get_current_row():
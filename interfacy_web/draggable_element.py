@@ -5,8 +5,6 @@ import typing as T
 
 from nicegui import ui
 
-_dragged: DraggableElement | None = None
-
 
 def check_type(t: T.Type, obj: T.Any) -> bool:
     """
@@ -14,16 +12,11 @@ def check_type(t: T.Type, obj: T.Any) -> bool:
         t (T.Type): The allowed type. If this is :class:`DraggableElement`, then any subclass of :class:`DraggableElement` is allowed.
         obj (T.Any): The object to check.
     """
-    if t is DraggableElement:
-        if issubclass(obj.__class__, DraggableElement):
-            return True
-        return False
-    if isinstance(obj, t):
-        return True
-    return False
+    return isinstance(obj, t)
 
 
 class DraggableElement(ui.card):
+    _dragged: DraggableElement | None = None
     highlight_border = "border-2 border-blue-300"
     dragged_background = "bg-blue-950"
 
@@ -32,7 +25,7 @@ class DraggableElement(ui.card):
         self.drag_enabled = drag_enabled
         self.width_class = width_class
 
-        with self.props("draggable").classes(f"cursor-pointer").classes(self.width_class).style(
+        with self.props("draggable").classes(f"cursor-pointer {self.width_class}").style(
             "box-shadow: none;"
         ):
             self.build()
@@ -72,9 +65,7 @@ class DraggableElement(ui.card):
             return
 
         self.classes(add=self.dragged_background)
-
-        global _dragged
-        _dragged = self
+        DraggableElement._dragged = self
 
     def on_dragenter(self) -> None:
         if not self.drag_enabled:
@@ -92,59 +83,62 @@ class DraggableElement(ui.card):
         self.classes(remove=self.dragged_background)
         if not self.drag_enabled:
             return
-        global _dragged
-        if not _dragged:
-            return
-
-        parent = self.get_parent()
-        if parent is None:
+        dragged = DraggableElement._dragged
+        if not dragged:
             return
 
-        children = parent.get_draggable_children()
-        try:
-            self_index = children.index(self)
-        except ValueError:
+        # Index among the draggable siblings, counted in one scan of the parent slot
+        self_index = 0
+        for child in self.parent_slot.children:
+            if child is self:
+                break
+            if isinstance(child, DraggableElement) and child.drag_enabled:
+                self_index += 1
+        else:
             return
 
-        _dragged.move(target_index=self_index)
+        dragged.move(target_index=self_index)
         self.on_dragleave()
-        _dragged.classes(remove=self.dragged_background)
+        dragged.classes(remove=self.dragged_background)
 
     def on_dragover_prevent(self):
         """Prevent default dragover event to allow drop event"""
         return
 
 
-class Row(ui.row):
+class _DraggableContainer:
+    """Shared drag and drop helpers for `Row` and `Column`."""
+
+    default_slot: T.Any
+
     def get_draggable_children(self) -> list[DraggableElement]:
-        children = []
-        for i in self.default_slot.children:
-            if issubclass(i.__class__, DraggableElement):
-                if i.drag_enabled:  # type:ignore
-                    children.append(i)
-        return children
+        return [
+            i
+            for i in self.default_slot.children
+            if isinstance(i, DraggableElement) and i.drag_enabled
+        ]
 
     def shuffle(self) -> None:
-        children = self.get_draggable_children()
+        """Shuffle the draggable children in place and send a single update to the client."""
+        slot_children = self.default_slot.children
+        positions = [
+            index
+            for index, i in enumerate(slot_children)
+            if isinstance(i, DraggableElement) and i.drag_enabled
+        ]
+        children = [slot_children[index] for index in positions]
         random.shuffle(children)
-        for i in children:
-            i.move(target_index=0)
+        for index, child in zip(positions, children):
+            slot_children[index] = child
+        self.update()
 
 
-class Column(ui.column):
-    def get_draggable_children(self) -> list[DraggableElement]:
-        children = []
-        for i in self.default_slot.children:
-            if issubclass(i.__class__, DraggableElement):
-                if i.drag_enabled:  # type:ignore
-                    children.append(i)
-        return children
+class Row(_DraggableContainer, ui.row):
+    pass
 
-    def shuffle(self) -> None:
-        children = self.get_draggable_children()
-        random.shuffle(children)
-        for i in children:
-            i.move(target_index=0)
+
+class Column(_DraggableContainer, ui.column):
+    pass
 
 
 __all__ = ["DraggableElement", "Column"]
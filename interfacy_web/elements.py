@@ -1,18 +1,20 @@
+import asyncio
 import datetime
 import os
 import typing as T
 from dataclasses import dataclass
-from functools import partial
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Optional
 
 from nicegui import ui
 from nicegui.element import Element
 from objinspect.util import get_enum_choices, get_literal_choices, is_enum, is_literal
-from stdl import dt, fs
+from stdl import fs
 
 from interfacy_web.file_picker import LocalFileDialog
 from interfacy_web.icons import ICONS
-from interfacy_web.util import clean_variable_name, is_valid_date
+from interfacy_web.util import clean_variable_name, is_valid_date, parse_date
 
 ui.colors(info="black")
 
@@ -33,6 +35,24 @@ Position = T.Literal[
 
 NotificationType = T.Literal["positive", "negative", "warning", "info", "ongoing"]
 
+_HEADING_PREFIXES = ("", "#", "##", "###", "####", "#####", "######")
+
+# Tooltip classes for every (dark_mode, mono_font, large) combination
+_TOOLTIP_CLASSES = {
+    (dark_mode, mono_font, large): " ".join(
+        i
+        for i in (
+            "bg-grey-2 text-black" if dark_mode else "bg-grey-10 text-white",
+            "font-mono" if mono_font else "",
+            "text-body2" if large else "",
+        )
+        if i
+    )
+    for dark_mode in (True, False)
+    for mono_font in (True, False)
+    for large in (True, False)
+}
+
 
 class Textarea(ui.textarea):
     def __init__(
@@ -76,6 +96,7 @@ class TextareaDialog(Element):
         cols: int | None = None,
         placeholder: str | None = None,
         autogrow: bool = True,
+        max_file_size: int = 5 * 1024 * 1024,
     ) -> None:
         self.data: str | None = None
         self.rows = rows
@@ -83,10 +104,11 @@ class TextareaDialog(Element):
         self.title = title
         self.placeholder = placeholder
         self.autogrow = autogrow
+        self.max_file_size = max_file_size
+        self.file_dialog = LocalFileDialog()
         super().__init__()
 
     async def open(self):
-        file_dialog = LocalFileDialog()
         with ui.dialog().classes("w-screen") as dialog, ui.card().classes("w-screen"):
             if self.title:
                 with ui.row().classes("items-center"):
@@ -104,15 +126,18 @@ class TextareaDialog(Element):
                 dialog.submit(textarea.value)
                 self.data = textarea.value
 
-            def import_file():
-                path = file_dialog.open()
+            async def import_file():
+                path = self.file_dialog.open()
                 if not path:
                     notification("No file selected", type="warning")
                     return
-                if os.path.isfile(path):
-                    textarea.value = fs.File(path).read()
-                else:
+                if not os.path.isfile(path):
                     notification(f"Invalid file '{path}'", type="warning")
+                    return
+                if os.path.getsize(path) > self.max_file_size:
+                    notification("File too large", type="warning")
+                    return
+                textarea.value = await asyncio.to_thread(fs.File(path).read)
 
             with ui.row().classes("items-start"):
                 ui.button("Done", icon="done", on_click=submit)
@@ -124,6 +149,8 @@ class TextareaDialog(Element):
 
 
 class DatePicker(Element):
+    _VALIDATION = {"Invalid date!": is_valid_date}
+
     def __init__(
         self,
         label: str = "Date",
@@ -135,9 +162,8 @@ class DatePicker(Element):
         if isinstance(value, datetime.date):
             value = value.strftime("%Y-%m-%d")
 
-        validation = {"Invalid date!": is_valid_date}
         with ui.input(
-            label, value=value or "", validation=validation, placeholder=placeholder
+            label, value=value or "", validation=self._VALIDATION, placeholder=placeholder
         ) as self.text_input:
             with self.text_input.add_slot("append"):
                 ui.icon("edit_calendar").on("click", lambda: self.menu.open()).classes(
@@ -150,7 +176,7 @@ class DatePicker(Element):
     def value(self) -> datetime.date | None:
         if not self.text_input.value:
             return None
-        return dt.parse_datetime_str(self.text_input.value).date()
+        return parse_date(self.text_input.value)
 
     @value.setter
     def value(self, value: datetime.date | None):
@@ -165,7 +191,7 @@ class DatePicker(Element):
         return self
 
 
-@dataclass()
+@dataclass(slots=True)
 class SelectOption:
     name: str
     value: str
@@ -181,28 +207,26 @@ async def select_popup(
     if not options:
         raise ValueError("Selection data must not be empty")
 
-    with ui.dialog().classes("items-center").classes(width_class) as dialog, ui.card().classes(
-        "items-center"
-    ).classes(width_class):
+    container_classes = f"items-center {width_class}"
+    with ui.dialog().classes(container_classes) as dialog, ui.card().classes(container_classes):
         if title:
             markdown_heading(title, level=4)
 
-        def submit(value):
-            dialog.submit(value)
-
-        def make_button():
-            button = ui.button(opt.name, on_click=partial(submit, value=opt.value))
-            if opt.tooltip:
+        def make_button(option: SelectOption):
+            button = ui.button(
+                option.name, on_click=lambda value=option.value: dialog.submit(value)
+            )
+            if option.tooltip:
                 with button:
-                    tooltip(opt.tooltip)
+                    tooltip(option.tooltip)
 
         with ui.row().classes("items-center"):
             for opt in options:
                 if one_per_row:
                     with ui.column().classes("items-center"):
-                        make_button()
+                        make_button(opt)
                 else:
-                    make_button()
+                    make_button(opt)
 
     selected = await dialog
     return selected
@@ -234,20 +258,18 @@ def markdown_heading(
 
 
     """
-    if level not in range(1, 7):
+    if not 1 <= level <= 6:
         raise ValueError("Size must be between 1 and 6")
 
-    level = "#" * level  # type: ignore
-    mdtitle = ui.markdown(f"{level} {value}")
+    mdtitle = ui.markdown(f"{_HEADING_PREFIXES[level]} {value}")
 
     if center:
         mdtitle = mdtitle.classes("text-center")
-    if background:
-        mdtitle = mdtitle.style(f"background-color: {background};")
 
-    mdtitle = mdtitle.style(f"margin: {margin}{unit};").style(
-        f"border-radius: {border_radius}{unit};"
-    )
+    style = f"margin: {margin}{unit}; border-radius: {border_radius}{unit};"
+    if background:
+        style = f"background-color: {background}; {style}"
+    mdtitle = mdtitle.style(style)
     if tooltip_text:
         tooltip(tooltip_text)
 
@@ -273,6 +295,22 @@ def list_popup(
     return dialog
 
 
+def _options_for_hint(hint) -> MappingProxyType[T.Any, str]:
+    # Literal["b", "a"] == Literal["a", "b"], so the arguments are part of the key to keep the order
+    return _cached_options_for_hint(hint, T.get_args(hint))
+
+
+@lru_cache(maxsize=128)
+def _cached_options_for_hint(hint, args: tuple) -> MappingProxyType[T.Any, str]:
+    if is_enum(hint):
+        choices = get_enum_choices(hint)
+    elif is_literal(hint):
+        choices = get_literal_choices(hint)
+    else:
+        raise ValueError(f"Type {type(hint)} not supported. Must be Enum or Literal")
+    return MappingProxyType({i: clean_variable_name(i) for i in choices})
+
+
 def select_from_type_hint(
     hint,
     *,
@@ -284,14 +322,7 @@ def select_from_type_hint(
     clearable: bool = False,
     width_class="w-40",
 ):
-    if is_enum(hint):
-        choices = get_enum_choices(hint)
-    elif is_literal(hint):
-        choices = get_literal_choices(hint)
-    else:
-        raise ValueError(f"Type {type(hint)} not supported. Must be Enum or Literal")
-
-    options = {i: clean_variable_name(i) for i in choices}
+    options = dict(_options_for_hint(hint))
 
     if value:
         if value not in options.keys():
@@ -333,13 +364,5 @@ def notification(
 
 
 def tooltip(message: str, large: bool = True, dark_mode: bool = True, mono_font: bool = True):
-    element = ui.tooltip(message)
-    if dark_mode:
-        element.classes("bg-grey-2").classes("text-black")
-    else:
-        element.classes("bg-grey-10").classes("text-white")
-    if mono_font:
-        element.classes("font-mono")
-    if large:
-        element.classes("text-body2")
-    return element
+    classes = _TOOLTIP_CLASSES[bool(dark_mode), bool(mono_font), bool(large)]
+    return ui.tooltip(message).classes(classes)
@@ -1,6 +1,10 @@
+import asyncio
 import os
+import sys
+import time
 import tkinter as tk
 import typing as T
+from functools import lru_cache
 from tkinter import filedialog
 
 from nicegui import ui
@@ -9,8 +13,28 @@ from stdl import fs
 
 from interfacy_web.icons import ICONS
 
-_TKINTER_ROOT = tk.Tk()  # For file dialogs
-_TKINTER_ROOT.withdraw()
+_TKINTER_ROOT: tk.Tk | None = None  # For file dialogs, created on first use
+_INPUT_CHECK_DELAY = 0.15  # Seconds without typing before a path is checked
+_EXISTS_CACHE_TTL = 2  # Seconds a cached path existence check stays valid
+_AUTO_COMPLETE_PUSH_DELAY = 0.1  # Seconds to collect new autocomplete entries before sending them
+
+
+def _tk_root() -> tk.Tk:
+    global _TKINTER_ROOT
+    if _TKINTER_ROOT is None:
+        _TKINTER_ROOT = tk.Tk()
+        _TKINTER_ROOT.withdraw()
+    return _TKINTER_ROOT
+
+
+@lru_cache(maxsize=256)
+def _exists_cached(path: str, time_bucket: int) -> bool:
+    return fs.exists(path)
+
+
+def path_exists(path: str) -> bool:
+    """Like `fs.exists`, but results are reused for up to `_EXISTS_CACHE_TTL` seconds."""
+    return _exists_cached(path, int(time.monotonic() // _EXISTS_CACHE_TTL))
 
 
 class FileType:
@@ -29,6 +53,21 @@ class FileType:
     ARCHIVE_FILES = ("Archive files", "*.zip;*.rar;*.tar;*.gz;*.bz2")
     DATA_FILES = ("Data files", "*.csv;*.json;*.xml;*.yaml;*.yml")
 
+    _TYPE_MAP = {
+        "all": ALL_FILES,
+        "text": TEXT_FILES,
+        "python": PYTHON_FILES,
+        "image": IMAGE_FILES,
+        "pdf": PDF_FILES,
+        "word": WORD_DOCUMENTS,
+        "excel": EXCEL_SPREADSHEETS,
+        "powerpoint": POWERPOINT_PRESENTATIONS,
+        "audio": AUDIO_FILES,
+        "video": VIDEO_FILES,
+        "archive": ARCHIVE_FILES,
+        "data": DATA_FILES,
+    }
+
     @staticmethod
     def get_types(*types: str) -> list[tuple[str, str]]:
         """Get a list of file type filters by name.
@@ -43,20 +82,7 @@ class FileType:
             >>> FILE_TYPE.get_types("all", "text", "python")
             [("All files", "*.*"), ("Text files", "*.txt"), ("Python files", "*.py")]
         """
-        type_dict = {
-            "all": FileType.ALL_FILES,
-            "text": FileType.TEXT_FILES,
-            "python": FileType.PYTHON_FILES,
-            "image": FileType.IMAGE_FILES,
-            "pdf": FileType.PDF_FILES,
-            "word": FileType.WORD_DOCUMENTS,
-            "excel": FileType.EXCEL_SPREADSHEETS,
-            "powerpoint": FileType.POWERPOINT_PRESENTATIONS,
-            "audio": FileType.AUDIO_FILES,
-            "video": FileType.VIDEO_FILES,
-            "archive": FileType.ARCHIVE_FILES,
-        }
-        return [type_dict[type] for type in types]
+        return [FileType._TYPE_MAP[type] for type in types]
 
 
 class LocalFileDialog:
@@ -100,8 +126,9 @@ class LocalFileDialog:
         return self.last_dir or self.initial_dir
 
     def open(self):
-        _TKINTER_ROOT.lift()  # Bring the root window to the front
-        _TKINTER_ROOT.attributes("-topmost", True)  # Make the root window always appear on top
+        root = _tk_root()
+        root.lift()  # Bring the root window to the front
+        root.attributes("-topmost", True)  # Make the root window always appear on top
         # filename = self.open_dialog_hidden()
 
         fn = self._save_dialog_hidden if self.mode == "save" else self._open_dialog_hidden
@@ -112,9 +139,14 @@ class LocalFileDialog:
                 filepath[0] if self.multiple and self.mode == "open" else filepath
             )
             self.chosen = filepath
-        _TKINTER_ROOT.update()  # To make the dialog close completely before the next line of code is run
+        # Process the pending redraw/close events so the dialog is gone before returning.
+        # Aqua on macOS may need a full event pass for that.
+        if sys.platform == "darwin":
+            root.update()
+        else:
+            root.update_idletasks()
 
-        _TKINTER_ROOT.attributes("-topmost", False)  # Reset the topmost attribute
+        root.attributes("-topmost", False)  # Reset the topmost attribute
         return filepath
 
     def _save_dialog_hidden(self):
@@ -174,7 +206,10 @@ class LocalFilePickerElement(Element):
         )
 
         self._add_file_exists_marker = add_file_exists_marker
-        self.auto_complete = []
+        self.auto_complete: list[str] = []
+        self._auto_complete_set: set[str] = set()
+        self._input_check: asyncio.Task | None = None
+        self._auto_complete_push: asyncio.TimerHandle | None = None
         self.filepath: str | None = None
         with ui.row().classes("items-center") as self.container:
             self.path_input = (
@@ -197,21 +232,56 @@ class LocalFilePickerElement(Element):
         if filename:
             self.filepath = filename
             self.path_input.value = filename
-            self.auto_complete.append(filename)
-            self.path_input.set_autocomplete(self.auto_complete)
+            self.add_auto_complete(filename)
         return filename
 
+    def add_auto_complete(self, value: str) -> None:
+        if value in self._auto_complete_set:
+            return
+        self._auto_complete_set.add(value)
+        self.auto_complete.append(value)
+        if self._auto_complete_push is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._push_auto_complete()
+            return
+        self._auto_complete_push = loop.call_later(
+            _AUTO_COMPLETE_PUSH_DELAY, self._push_auto_complete
+        )
+
+    def _push_auto_complete(self) -> None:
+        self._auto_complete_push = None
+        self.path_input.set_autocomplete(self.auto_complete)
+
     def on_input_change(self):
+        """Check the typed path in a worker thread once the input has been idle for a moment."""
+        if self._input_check is not None:
+            self._input_check.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            value = self.path_input.value
+            self._show_path_status(value, bool(value) and path_exists(value))
+            return
+        self._input_check = loop.create_task(self._check_input())
+
+    async def _check_input(self):
+        await asyncio.sleep(_INPUT_CHECK_DELAY)
         value = self.path_input.value
+        exists = bool(value) and await asyncio.to_thread(path_exists, value)
+        self._show_path_status(value, exists)
+
+    def _show_path_status(self, value: str, exists: bool):
         if not value:
             if self._add_file_exists_marker:
                 self.label_file_exists.text = "  "
             return
-        if fs.exists(value):
+        if exists:
             if self._add_file_exists_marker:
                 self.label_file_exists.text = "🟢"
-            self.auto_complete.append(value)
-            self.path_input.set_autocomplete(self.auto_complete)
+            self.add_auto_complete(value)
         else:
             if self._add_file_exists_marker:
                 self.label_file_exists.text = "🔴"
@@ -30,12 +30,14 @@ DEFAULT_VALUES = {
 STR_PARSER = get_parser()
 
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def element_for_type(t: T.Type) -> Element:
-    if t in INPUT_ELEMENTS:
-        return INPUT_ELEMENTS[t]
-    if args := T.get_args(t):
-        for i in args:
-            if i in INPUT_ELEMENTS:
-                return INPUT_ELEMENTS[i]
+    element = INPUT_ELEMENTS.get(t)
+    if element is not None:
+        return element
+    if T.get_origin(t) is not None:
+        for i in T.get_args(t):
+            element = INPUT_ELEMENTS.get(i)
+            if element is not None:
+                return element
     raise ValueError(f"No input element for type {t}")
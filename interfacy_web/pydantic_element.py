@@ -1,4 +1,5 @@
 import typing as T
+from functools import lru_cache
 
 from nicegui.element import Element
 from objinspect import Parameter
@@ -8,7 +9,11 @@ from pydantic import BaseModel
 
 from interfacy_web.class_element import ClassElement
 
+# Prefix of the docstring pydantic's BaseModel passes down to models without their own
+_PYDANTIC_DOCS_MARKER = "Usage docs: https://docs.pydantic.dev"
 
+
+@lru_cache(maxsize=None)
 def get_pydantic_init_params(model: T.Type[BaseModel]) -> dict[str, Parameter]:
     """
     Args:
@@ -73,17 +78,18 @@ class PydanticModelElement(ClassElement):
     def get_description(self, description: str | None) -> str | None:
         if not description:
             return None
-        if "Usage docs: https:///docs.pyndantic.dev" in description:
+        if description.startswith(_PYDANTIC_DOCS_MARKER):
             return None
         return description
 
     def get_init_params(self) -> dict[str, Parameter]:
-        return get_pydantic_init_params(self.cls)
+        model = self.cls if isinstance(self.cls, type) else type(self.cls)
+        return get_pydantic_init_params(model)
 
     def build(self) -> None:
         self.build_title_row()
 
-        for param in self.get_init_params().values():
+        for param in self._init_params.values():
             with self.get_current_row():
                 self.add_input_element_for_param(param)
 
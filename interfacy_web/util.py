@@ -1,13 +1,36 @@
+import datetime
+import re
+import types
 import typing as T
 from functools import lru_cache
 
 from nicegui.element import Element
 from objinspect import Class, Parameter
 from objinspect.util import type_to_str
-from stdl import dt, st
+from stdl import dt
+
+
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_UPPERCASE_RUN_RE = re.compile("([A-Z]+)")
+_CAPITALIZED_WORD_RE = re.compile("([A-Z][a-z]+)")
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_iso_date(string: str) -> bool:
+    try:
+        datetime.date.fromisoformat(string)
+        return True
+    except ValueError:
+        return False
 
 
 def is_valid_date(string: str) -> bool:
+    if not string or string.isspace():
+        return False
+    if _ISO_DATE_RE.fullmatch(string):
+        # The format DatePicker writes, no need for the full parser
+        return _is_valid_iso_date(string)
+    # Not cached, dateutil fills in missing parts relative to today ("31" is not valid every month)
     try:
         dt.parse_datetime_str(string)
         return True
@@ -15,26 +38,71 @@ def is_valid_date(string: str) -> bool:
         return False
 
 
+def parse_date(string: str) -> datetime.date:
+    if _ISO_DATE_RE.fullmatch(string):
+        return datetime.date.fromisoformat(string)
+    # Not cached, dateutil fills in missing parts ("Jan 5", "Monday") relative to today
+    return dt.parse_datetime_str(string).date()
+
+
 def err_message_missing_param(param: Parameter) -> str:
     return f"Missing required argument '{param.name}' with type '{type_to_str(param.type)}'"
 
 
 def clean_variable_name(name: str) -> str:
-    return st.snake_case(name).replace("_", " ").title()
+    # Same word splitting as st.snake_case, with the patterns compiled once
+    name = _UPPERCASE_RUN_RE.sub(r" \1", name.replace("-", " "))
+    name = _CAPITALIZED_WORD_RE.sub(r" \1", name)
+    return " ".join(name.split()).replace("_", " ").title()
+
+
+@lru_cache(maxsize=None)
+def _decompose_type(t: T.Type) -> tuple[T.Any, bool]:
+    """
+    Split `t` into its origin (None for plain types) and whether a value can be checked against it.
+    `Optional[X]` and `X | None` compare equal and share a cache entry, so both union forms
+    get the same result.
+    """
+    origin = T.get_origin(t)
+    if origin is None:
+        return None, True
+    if origin is T.Union or origin is types.UnionType:
+        # Unions can't be used with isinstance, let the parser handle them
+        return origin, False
+    return origin, all(isinstance(arg, type) for arg in T.get_args(t))
 
 
 def is_type(val: T.Any, t: T.Type) -> bool:
-    if T.get_origin(t) is None:
+    origin, checkable = _decompose_type(t)
+    if origin is None:
         return type(val) is t
-    else:
-        origin = T.get_origin(t)
+    return checkable and isinstance(val, origin)
+
+
+@lru_cache(maxsize=None)
+def exact_types(t: T.Any) -> tuple[type, ...]:
+    """
+    Get the types a value can have to match `t` exactly, without any parsing.
+    For a plain type that is the type itself, for `X | None` it is `X` and `NoneType`.
+    Other unions are left to the parser, which may convert values of a member type.
+    """
+    origin = T.get_origin(t)
+    if origin is None:
+        return (t,) if isinstance(t, type) else ()
+    if origin is T.Union or origin is types.UnionType:
         args = T.get_args(t)
-        return isinstance(val, origin) and all(isinstance(arg, type) for arg in args)
+        if len(args) == 2 and types.NoneType in args:
+            return tuple(i for i in args if isinstance(i, type))
+    return ()
+
+
+def element_takes_label(e: T.Type[Element] | Element) -> bool:
+    return _element_class_takes_label(e if isinstance(e, type) else type(e))
 
 
-@lru_cache()
-def element_takes_label(e: Element) -> bool:
-    obj = Class(e)
+@lru_cache(maxsize=None)
+def _element_class_takes_label(cls: T.Type[Element]) -> bool:
+    obj = Class(cls)
     init_method = obj.init_method
     if not init_method:
         return False